@@ -1,11 +1,24 @@
 import numpy as np
-import matplotlib.pyplot as plt  # por compatibilidad, aunque usamos Figure
-import pandas as pd
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+# pandas y matplotlib se importan al usarse (ver leer_tabla_parametros,
+# generar_formato_vacio y crear_grafica) para que el programa abra rápido
+
+# Numba es opcional: si no está instalado, el integrador corre en Python puro
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# numexpr también es opcional: si no está, β(t) se calcula con NumPy
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
 
 # -----------------------------
 # Constantes y nombres de meses
@@ -16,6 +29,56 @@ MESES = [
     "Septiembre", "Octubre", "Noviembre", "Diciembre"
 ]
 DAYS_POR_MES = 30  # aproximación para mostrar meses en el eje X
+DOS_PI_ENTRE_365 = 2.0 * np.pi / 365.0  # frecuencia del ciclo anual de β(t)
+MAX_PUNTOS_GRAFICA = 2000  # en simulaciones largas se grafica 1 de cada N días
+MAX_ESCENARIOS_GRAFICA = 10  # en lotes más grandes sólo se grafican los de mayor pico
+
+# numexpr sólo le gana a NumPy con arreglos grandes y varios hilos: con un
+# año (729 medios días) tarda el doble y con un hilo es más lento en todos
+# los tamaños medidos. Por debajo de este número de elementos se usa NumPy.
+MIN_ELEMENTOS_NUMEXPR = 1_000_000
+
+# Plantillas de títulos (SEIR, β) según (hay año de referencia, dura ~1 año)
+PLANTILLAS_TITULOS = {
+    (True, True): (
+        "Modelo estacional {nombre} {rango}",
+        "Tasa de transmisión β(t) - {nombre} {rango}",
+    ),
+    (True, False): (
+        "Modelo SEIR {nombre} {rango} (~{dias} días)",
+        "Tasa de transmisión β(t) - {nombre} {rango} (~{dias} días)",
+    ),
+    (False, True): (
+        "Modelo estacional SEIR",
+        "Tasa de transmisión β(t) estacional",
+    ),
+    (False, False): (
+        "Modelo SEIR (~{dias} días)",
+        "Tasa de transmisión β(t) (~{dias} días)",
+    ),
+}
+
+# Si E + I queda por debajo de este número de personas (después de
+# DIAS_MIN_EXTINCION días) el brote se da por terminado y se deja de integrar
+UMBRAL_EXTINCION = 0.5
+DIAS_MIN_EXTINCION = 30
+
+# Escenarios que se integran juntos en un lote grande. El valor se eligió
+# midiendo con Numba (~25 % más rápido que integrar todo el lote de una vez);
+# no es el tamaño de ninguna caché: cada etapa de RK4 maneja en float64 más
+# de 20 vectores de este largo (estado, k1..k4 y temporales).
+TAM_BLOQUE_ESCENARIOS = 1638
+
+# Columnas de la hoja 'Datos' (plantilla de Excel/CSV)
+COLUMNAS_DATOS = [
+    "Año del escenario", "Nombre del lugar",
+    "Población total (N)", "Infectados iniciales (I0)",
+    "Expuestos iniciales (E0)", "Recuperados iniciales (R0)",
+    "Tasa base de transmisión (beta0)",
+    "Días de incubación", "Días infecciosos",
+    "Días de simulación",
+    "Fuerza estacional (0 a 1)",
+]
 
 
 # ===========================
@@ -25,11 +88,196 @@ DAYS_POR_MES = 30  # aproximación para mostrar meses en el eje X
 def beta_sazonal(t, beta0, fuerza_estacional):
     """
     Función de transmisión estacional.
-    t: tiempo en días
+    t: tiempo en días (escalar o arreglo de NumPy)
     beta0: tasa base de transmisión
     fuerza_estacional: amplitud (0 a 1)
+    Con numexpr instalado y arreglos grandes (lotes de muchos escenarios) la
+    expresión se evalúa en varios hilos, sin arreglos intermedios.
+    """
+    if (
+        ne is not None
+        and ne.get_num_threads() > 1
+        and np.size(t) * np.size(beta0) >= MIN_ELEMENTOS_NUMEXPR
+    ):
+        return ne.evaluate(
+            "beta0 * (1.0 + fuerza_estacional * sin(w * t))",
+            local_dict={
+                "beta0": beta0,
+                "fuerza_estacional": fuerza_estacional,
+                "w": DOS_PI_ENTRE_365,
+                "t": t,
+            },
+        )
+    return beta0 * (1.0 + fuerza_estacional * np.sin(DOS_PI_ENTRE_365 * t))
+
+
+@njit(cache=True, fastmath=True)
+def _seir_rhs_escalar(s, e, i, b, inv_N, sigma, gamma):
+    """
+    Lado derecho del SEIR clásico de un escenario: derivadas
+    (dS, dE, dI, dR) para β = b.
+    """
+    contagios = b * s * i * inv_N
+    nuevos_i = sigma * e
+    nuevos_r = gamma * i
+    return -contagios, contagios - nuevos_i, nuevos_i - nuevos_r, nuevos_r
+
+
+@njit(cache=True, fastmath=True)
+def _seir_step_escalar(S, E, I, R, S0, E0, I0, R0, beta_medio, inv_N, sigma, gamma, dias):
+    """
+    Igual que _seir_step para el caso más común (un escenario, kE = kI = 1),
+    con el estado en escalares: sin Numba es varias veces más rápida que la
+    versión con cadenas y lotes, que reserva arreglos en cada etapa.
+    S, E, I, R, beta_medio: arreglos 1-D; S0, E0, I0, R0, inv_N, sigma,
+    gamma: escalares. Devuelve (peak_value, peak_day, dia_extincion) como
+    escalares.
     """
-    return beta0 * (1.0 + fuerza_estacional * np.sin(2.0 * np.pi * t / 365.0))
+    s = S0
+    e = E0
+    i = I0
+    r = R0
+    peak_value = i
+    peak_day = 0
+
+    for day in range(1, dias):
+        b_ini = beta_medio[2 * day - 2]
+        b_mid = beta_medio[2 * day - 1]
+        b_fin = beta_medio[2 * day]
+
+        k1s, k1e, k1i, k1r = _seir_rhs_escalar(s, e, i, b_ini, inv_N, sigma, gamma)
+        k2s, k2e, k2i, k2r = _seir_rhs_escalar(
+            s + 0.5 * k1s, e + 0.5 * k1e, i + 0.5 * k1i, b_mid, inv_N, sigma, gamma
+        )
+        k3s, k3e, k3i, k3r = _seir_rhs_escalar(
+            s + 0.5 * k2s, e + 0.5 * k2e, i + 0.5 * k2i, b_mid, inv_N, sigma, gamma
+        )
+        k4s, k4e, k4i, k4r = _seir_rhs_escalar(s + k3s, e + k3e, i + k3i, b_fin, inv_N, sigma, gamma)
+
+        s += (k1s + 2.0 * k2s + 2.0 * k3s + k4s) / 6.0
+        e += (k1e + 2.0 * k2e + 2.0 * k3e + k4e) / 6.0
+        i += (k1i + 2.0 * k2i + 2.0 * k3i + k4i) / 6.0
+        r += (k1r + 2.0 * k2r + 2.0 * k3r + k4r) / 6.0
+
+        S[day] = s
+        E[day] = e
+        I[day] = i
+        R[day] = r
+
+        if i > peak_value:
+            peak_value = i
+            peak_day = day
+
+        if day > DIAS_MIN_EXTINCION and E[day] + I[day] < UMBRAL_EXTINCION:
+            for d in range(day + 1, dias):
+                S[d] = s
+                E[d] = 0.0
+                I[d] = 0.0
+                R[d] = r
+            return peak_value, peak_day, day
+
+    return peak_value, peak_day, -1
+
+
+@njit(cache=True, fastmath=True)
+def _derivada_cadena(x, tasa, entrada):
+    """
+    Derivada de una cadena de Erlang: cada etapa (fila de x) recibe lo que
+    sale de la anterior (la primera recibe 'entrada') y pierde 'tasa' por día.
+    Las columnas de x son escenarios independientes.
+    """
+    dx = np.empty_like(x)
+    dx[0] = entrada - tasa * x[0]
+    dx[1:] = tasa * (x[:-1] - x[1:])
+    return dx
+
+
+@njit(cache=True, fastmath=True)
+def _seir_rhs(s, e, i, b, inv_N, tasa_e, tasa_i):
+    """
+    Lado derecho del sistema SEIR con E e I divididos en etapas:
+    derivadas (dS, dE, dI, dR) para β = b, para todos los escenarios a la vez.
+    """
+    contagios = b * s * i.sum(axis=0) * inv_N
+    de = _derivada_cadena(e, tasa_e, contagios)
+    di = _derivada_cadena(i, tasa_i, tasa_e * e[-1])
+    return -contagios, de, di, tasa_i * i[-1]
+
+
+@njit(cache=True, fastmath=True)
+def _seir_step(S, E, I, R, S0, E0, I0, R0, beta_medio, inv_N, sigma, gamma, kE, kI, dias):
+    """
+    Integra el modelo SEIR con Runge-Kutta de orden 4 (paso 1 día)
+    llenando S, E, I, R in situ.
+    S, E, I, R: arreglos (dias, P), una columna por escenario. Pueden ser
+    float32: el estado se lleva en float64 y sólo se redondea al guardarlo.
+    S0, E0, I0, R0: condición inicial, arreglos (P,) en float64 (no se lee
+    de la fila 0, que puede estar redondeada).
+    beta_medio: β evaluada cada medio día, forma (2*dias - 1, P), para las
+    etapas intermedias de RK4.
+    inv_N, sigma, gamma: arreglos (P,); inv_N = 1/N, precalculado para
+    multiplicar en lugar de dividir.
+    kE, kI: número de etapas de E e I (con 1 se tiene el SEIR clásico).
+    Devuelve (peak_value, peak_day, dia_extincion): máximo de I y primer día
+    en que ocurre, por escenario, calculados durante la integración, y el
+    día en que el brote se extinguió en todos los escenarios (-1 si no).
+    Desde ese día S y R se mantienen constantes y E e I valen 0.
+    """
+    # S y R se llevan como vectores (P,); E e I como cadenas (etapas, P).
+    # Las condiciones iniciales de E e I se reparten por igual entre etapas.
+    tasa_e = kE * sigma
+    tasa_i = kI * gamma
+    s = S0.copy()
+    r = R0.copy()
+    e = np.empty((kE, S.shape[1]))
+    i = np.empty((kI, S.shape[1]))
+    for k in range(kE):
+        e[k] = E0 / kE
+    for k in range(kI):
+        i[k] = I0 / kI
+    peak_value = I0.copy()
+    peak_day = np.zeros(S.shape[1], dtype=np.int64)
+
+    for day in range(1, dias):
+        b_ini = beta_medio[2 * day - 2]
+        b_mid = beta_medio[2 * day - 1]
+        b_fin = beta_medio[2 * day]
+
+        k1s, k1e, k1i, k1r = _seir_rhs(s, e, i, b_ini, inv_N, tasa_e, tasa_i)
+        k2s, k2e, k2i, k2r = _seir_rhs(
+            s + 0.5 * k1s, e + 0.5 * k1e, i + 0.5 * k1i, b_mid, inv_N, tasa_e, tasa_i
+        )
+        k3s, k3e, k3i, k3r = _seir_rhs(
+            s + 0.5 * k2s, e + 0.5 * k2e, i + 0.5 * k2i, b_mid, inv_N, tasa_e, tasa_i
+        )
+        k4s, k4e, k4i, k4r = _seir_rhs(s + k3s, e + k3e, i + k3i, b_fin, inv_N, tasa_e, tasa_i)
+
+        s = s + (k1s + 2.0 * k2s + 2.0 * k3s + k4s) / 6.0
+        e = e + (k1e + 2.0 * k2e + 2.0 * k3e + k4e) / 6.0
+        i = i + (k1i + 2.0 * k2i + 2.0 * k3i + k4i) / 6.0
+        r = r + (k1r + 2.0 * k2r + 2.0 * k3r + k4r) / 6.0
+
+        i_total = i.sum(axis=0)
+        S[day] = s
+        E[day] = e.sum(axis=0)
+        I[day] = i_total
+        R[day] = r
+
+        # pico: se guarda el primer día con el máximo de enfermos
+        nuevo_pico = i_total > peak_value
+        peak_value = np.where(nuevo_pico, i_total, peak_value)
+        peak_day = np.where(nuevo_pico, day, peak_day)
+
+        # brote extinguido en todos los escenarios: el resto de los días es fijo
+        if day > DIAS_MIN_EXTINCION and np.all(E[day] + I[day] < UMBRAL_EXTINCION):
+            for d in range(day + 1, dias):
+                S[d] = s
+                E[d] = 0.0
+                I[d] = 0.0
+                R[d] = r
+            return peak_value, peak_day, day
+
+    return peak_value, peak_day, -1
 
 
 def correr_simulacion(
@@ -41,86 +289,157 @@ def correr_simulacion(
     anio=None,
     nombre=None,
     days_por_mes=DAYS_POR_MES,
+    kE=1,
+    kI=1,
+    dtype=None,
 ):
     """
-    Modelo SEIR con integración por Euler (paso 1 día).
+    Modelo SEIR con integración por Runge-Kutta de orden 4 (paso 1 día).
+    kE, kI: etapas de incubación y de contagio (cadenas de Erlang). Con más
+    etapas la duración de cada fase es menos dispersa y el pico más realista;
+    con 1 (valor por defecto) se obtiene el SEIR clásico.
+    dtype: tipo de los arreglos de resultados. Por defecto (None) se usa
+    float32, que ocupa la mitad de memoria y basta para poblaciones de hasta
+    2**24 (~16 millones, error menor a 1 persona), y float64 si alguna N es
+    mayor. La integración siempre se hace en float64.
+
+    Simulación por lotes: N, I0, E0, R0, beta0, dias_incubacion,
+    dias_infecciosos y fuerza_estacional pueden ser arreglos 1-D de largo P
+    (uno por escenario); todos los escenarios se integran juntos. En ese caso
+    S, E, I, R y beta_t tienen forma (dias, P), las estadísticas son arreglos
+    o listas de largo P y 'nombre' puede ser una lista con un nombre por
+    escenario. Con parámetros escalares el resultado es el de siempre.
     NO dibuja gráficas, sólo devuelve los resultados y estadísticas.
     """
     try:
+        params = [N, I0, E0, R0, beta0, dias_incubacion, dias_infecciosos, fuerza_estacional]
+        es_lote = any(np.ndim(p) > 0 for p in params)
+        # broadcast_arrays devuelve vistas de sólo lectura; se copian porque
+        # algunas pasan a los kernels de Numba
+        (N, I0, E0, R0, beta0,
+         dias_incubacion, dias_infecciosos, fuerza_estacional) = [
+            p.copy() for p in np.broadcast_arrays(
+                *[np.atleast_1d(np.asarray(p, dtype=float)) for p in params]
+            )
+        ]
+        P = len(N)
+
         # Validaciones
-        if N <= 0:
+        if np.any(N <= 0):
             messagebox.showwarning("Dato inválido", "La población total debe ser mayor que 0.")
             return None
         if dias <= 0:
             messagebox.showwarning("Dato inválido", "Los días de simulación deben ser mayores que 0.")
             return None
-        if dias_incubacion <= 0 or dias_infecciosos <= 0:
+        if np.any(dias_incubacion <= 0) or np.any(dias_infecciosos <= 0):
             messagebox.showwarning(
                 "Dato inválido",
                 "Los días de incubación y de etapa contagiosa deben ser mayores que 0."
             )
             return None
+        if kE < 1 or kI < 1:
+            messagebox.showwarning(
+                "Dato inválido",
+                "El número de etapas de incubación y de contagio debe ser al menos 1."
+            )
+            return None
 
         sigma = 1.0 / dias_incubacion
         gamma = 1.0 / dias_infecciosos
+        inv_N = 1.0 / N
         dias = int(dias)
+        kE = int(kE)
+        kI = int(kI)
 
         S0 = N - I0 - E0 - R0
-        if S0 < 0:
+        if np.any(S0 < 0):
             messagebox.showwarning(
                 "Dato inválido",
                 "La suma de infectados, expuestos e inmunes iniciales es mayor que la población total."
             )
             return None
 
-        # Arrays
+        # Arrays: una fila por día, una columna por escenario.
+        # Sin inicializar: la fila 0 se escribe abajo y el resto el integrador.
         t = np.arange(0, dias)
-        S = np.zeros(dias)
-        E = np.zeros(dias)
-        I = np.zeros(dias)
-        R = np.zeros(dias)
-        beta_t = np.zeros(dias)
+        if dtype is None:
+            dtype = np.float64 if N.max() > 2**24 else np.float32
+        S = np.empty((dias, P), dtype=dtype)
+        E = np.empty((dias, P), dtype=dtype)
+        I = np.empty((dias, P), dtype=dtype)
+        R = np.empty((dias, P), dtype=dtype)
+
+        # β cada medio día (etapas intermedias de RK4) en una sola operación
+        # vectorizada; β(t) en días enteros son las filas pares, sin recalcular
+        beta_medio = beta_sazonal(
+            np.arange(0, 2 * dias - 1)[:, None] * 0.5, beta0, fuerza_estacional
+        )
+        beta_t = beta_medio[::2].astype(dtype)
 
         S[0] = S0
         E[0] = E0
         I[0] = I0
         R[0] = R0
-        beta_t[0] = beta_sazonal(0, beta0, fuerza_estacional)
-
-        # Integración por Euler
-        for day in range(1, dias):
-            beta_val = beta_sazonal(day, beta0, fuerza_estacional)
-            beta_t[day] = beta_val
-
-            dS = -beta_val * S[day - 1] * I[day - 1] / N
-            dE = beta_val * S[day - 1] * I[day - 1] / N - sigma * E[day - 1]
-            dI = sigma * E[day - 1] - gamma * I[day - 1]
-            dR = gamma * I[day - 1]
-
-            S[day] = S[day - 1] + dS
-            E[day] = E[day - 1] + dE
-            I[day] = I[day - 1] + dI
-            R[day] = R[day - 1] + dR
-
-        # Estadísticas de pico
-        if np.all(I == 0):
-            peak_idx = 0
-        else:
-            peak_idx = int(np.argmax(I))  # índice del día del pico
 
-        peak_day = peak_idx
-        peak_value = float(I[peak_idx])
-        peak_month_idx = int((peak_day // days_por_mes) % 12)  # 0-11
-        peak_month_name = MESES[peak_month_idx]
+        # Integración por RK4 (compilada con Numba si está disponible)
+        # junto con las estadísticas de pico. Los lotes grandes se integran
+        # por bloques de escenarios para que el estado se quede en caché
+        # durante todos los días.
+        # Si todos los bloques se extinguen antes del final, dia_extincion es
+        # el último de esos días; si alguno no, queda en None.
+        peak_value = np.empty(P)
+        peak_day = np.empty(P, dtype=np.int64)
+        dia_extincion = 0
+        for p0 in range(0, P, TAM_BLOQUE_ESCENARIOS):
+            b = slice(p0, p0 + TAM_BLOQUE_ESCENARIOS)
+            if P == 1 and kE == 1 and kI == 1:
+                # SEIR clásico de un escenario: versión con estado escalar
+                peak_value[b], peak_day[b], dia_bloque = _seir_step_escalar(
+                    S[:, 0], E[:, 0], I[:, 0], R[:, 0],
+                    float(S0[0]), float(E0[0]), float(I0[0]), float(R0[0]),
+                    beta_medio[:, 0],
+                    float(inv_N[0]), float(sigma[0]), float(gamma[0]), dias
+                )
+            else:
+                peak_value[b], peak_day[b], dia_bloque = _seir_step(
+                    S[:, b], E[:, b], I[:, b], R[:, b],
+                    S0[b], E0[b], I0[b], R0[b], beta_medio[:, b],
+                    inv_N[b], sigma[b], gamma[b], kE, kI, dias
+                )
+            if dia_bloque < 0 or dia_extincion is None:
+                dia_extincion = None
+            else:
+                dia_extincion = max(dia_extincion, int(dia_bloque))
+        peak_month_name = [MESES[int((d // days_por_mes) % 12)] for d in peak_day]
 
-        total_recuperados = float(R[-1])
-        final_infectados = float(I[-1])
+        total_recuperados = R[-1]
+        final_infectados = I[-1]
         total_casos_estimados = total_recuperados + final_infectados
 
+        if es_lote:
+            if nombre is None or isinstance(nombre, str):
+                nombres = [f"Escenario {k + 1}" for k in range(P)]
+            else:
+                nombres = [str(n) for n in nombre]
+            nombre = None
+        else:
+            # un solo escenario: series 1-D y estadísticas escalares
+            nombres = None
+            S, E, I, R, beta_t = S[:, 0], E[:, 0], I[:, 0], R[:, 0], beta_t[:, 0]
+            peak_day = int(peak_day[0])
+            peak_value = float(peak_value[0])
+            peak_month_name = peak_month_name[0]
+            total_recuperados = float(total_recuperados[0])
+            final_infectados = float(final_infectados[0])
+            total_casos_estimados = float(total_casos_estimados[0])
+
         # --------------------------
         # Construcción de títulos
         # --------------------------
-        nombre_str = nombre if (nombre is not None and str(nombre).strip() != "") else "escenario"
+        if es_lote:
+            nombre_str = "varios escenarios" if P > 1 else nombres[0]
+        else:
+            nombre_str = nombre if (nombre is not None and str(nombre).strip() != "") else "escenario"
 
         rango_str = ""
         approx_years = None
@@ -129,9 +448,8 @@ def correr_simulacion(
             anio_base = int(anio)         # año de los datos (ej. 2024)
             anio_inicio = anio_base + 1   # año en que empieza la simulación (ej. 2025)
 
-            # Años aproximados que cubre la simulación
-            duracion_anios = dias / 365.0
-            approx_years = max(1, int(np.ceil(duracion_anios)))
+            # Años aproximados que cubre la simulación (techo entero de dias / 365)
+            approx_years = max(1, -(-dias // 365))
             anio_fin = anio_inicio + approx_years - 1
 
             if approx_years == 1:
@@ -141,24 +459,14 @@ def correr_simulacion(
                 # rango aproximado (ej. 1000 días -> ~3 años)
                 rango_str = f"{anio_inicio}-{anio_fin}"
 
-        # Elegimos el texto del título
-        if rango_str:
-            # hay información de años
-            es_anio_completo = (dias >= 360 and dias <= 370 and approx_years == 1)
-            if es_anio_completo:
-                titulo_seir = f"Modelo estacional {nombre_str} {rango_str}"
-                titulo_beta = f"Tasa de transmisión β(t) - {nombre_str} {rango_str}"
-            else:
-                titulo_seir = f"Modelo SEIR {nombre_str} {rango_str} (~{dias} días)"
-                titulo_beta = f"Tasa de transmisión β(t) - {nombre_str} {rango_str} (~{dias} días)"
-        else:
-            # sin año de referencia
-            if dias >= 360 and dias <= 370:
-                titulo_seir = "Modelo estacional SEIR"
-                titulo_beta = "Tasa de transmisión β(t) estacional"
-            else:
-                titulo_seir = f"Modelo SEIR (~{dias} días)"
-                titulo_beta = f"Tasa de transmisión β(t) (~{dias} días)"
+        # Elegimos el texto del título: con año de referencia, la simulación
+        # cuenta como "un año" sólo si además no se sale del año de inicio
+        hay_anio = rango_str != ""
+        es_anio_completo = 360 <= dias <= 370 and (not hay_anio or approx_years == 1)
+        titulo_seir, titulo_beta = [
+            plantilla.format(nombre=nombre_str, rango=rango_str, dias=dias)
+            for plantilla in PLANTILLAS_TITULOS[(hay_anio, es_anio_completo)]
+        ]
 
         resultados = {
             "t": t,
@@ -176,6 +484,9 @@ def correr_simulacion(
             "dias": dias,
             "anio": anio,
             "nombre": nombre,
+            "lote": es_lote,
+            "dia_extincion": dia_extincion,
+            "nombres": nombres,
             "titulo_seir": titulo_seir,
             "titulo_beta": titulo_beta,
         }
@@ -196,6 +507,14 @@ fig = None
 ax = None
 canvas = None
 hover_cursor = None   # cursor de mplcursors para hover
+texto_inicial = None  # mensaje mostrado antes de la primera simulación
+
+# Curvas y marcas de la gráfica: se crean una vez y luego se actualizan con
+# set_data / set_visible en lugar de borrar y volver a dibujar los ejes
+lineas_seir = []      # S, E, I, R de un escenario
+lineas_lote = []      # una curva de I por escenario
+lineas_beta = []      # β(t), una por escenario
+artistas_pico = {}    # marcador, línea vertical y nota del pico
 
 
 def leer_float(entry, nombre_campo):
@@ -227,6 +546,21 @@ def leer_int_opcional(entry):
 
 
 def actualizar_labels_resultados(res):
+    if res["lote"]:
+        # en un lote se resume el escenario con el pico más alto
+        k = int(np.argmax(res["peak_value"]))
+        label_peak_val.config(
+            text=f"Pico de personas enfermas: {res['peak_value'][k]:.0f} ({res['nombres'][k]})"
+        )
+        label_peak_mes.config(text=f"Mes del pico: {res['peak_month_name'][k]}")
+        label_final_rec.config(
+            text=f"Personas recuperadas al final: {res['total_recuperados'][k]:.0f}"
+        )
+        label_total_casos.config(
+            text=f"Casos acumulados aproximados: {res['total_casos_estimados'][k]:.0f}"
+        )
+        return
+
     label_peak_val.config(text=f"Pico de personas enfermas: {res['peak_value']:.0f}")
     label_peak_mes.config(text=f"Mes del pico: {res['peak_month_name']}")
     label_final_rec.config(text=f"Personas recuperadas al final: {res['total_recuperados']:.0f}")
@@ -237,17 +571,12 @@ def preparar_eje_meses(ax_local, dias):
     """
     Configura el eje X en función de meses con nombres reales.
     """
-    meses_totales = int(np.ceil(dias / float(DAYS_POR_MES)))
+    meses_totales = -(-int(dias) // DAYS_POR_MES)  # techo entero
     max_ticks = 24
-    step_meses = 1
-    if meses_totales > max_ticks:
-        step_meses = int(np.ceil(meses_totales / max_ticks))
+    step_meses = max(1, -(-meses_totales // max_ticks))  # techo entero
 
-    month_positions = np.arange(0, meses_totales, step_meses) * DAYS_POR_MES
-    month_positions = month_positions[month_positions < dias]
-
-    month_indices = ((month_positions // DAYS_POR_MES) % 12).astype(int)
-    month_labels = [MESES[i] for i in month_indices]
+    month_positions = np.arange(0, dias, DAYS_POR_MES * step_meses, dtype=np.int64)
+    month_labels = [MESES[(p // DAYS_POR_MES) % 12] for p in month_positions]
 
     ax_local.set_xticks(month_positions)
     ax_local.set_xticklabels(month_labels, rotation=45, ha="right")
@@ -267,8 +596,101 @@ def limpiar_hover():
         hover_cursor = None
 
 
+def activar_hover(lineas, texto_anotacion):
+    """
+    Activa el hover de mplcursors sobre 'lineas'. texto_anotacion(sel)
+    devuelve el texto de cada anotación.
+    """
+    global hover_cursor
+    try:
+        import mplcursors
+
+        hover_cursor = mplcursors.cursor(lineas, hover=True)
+        hover_cursor.connect(
+            "add", lambda sel: sel.annotation.set_text(texto_anotacion(sel))
+        )
+    except Exception:
+        messagebox.showinfo(
+            "Interactividad no disponible",
+            "Para activar hover instala la librería 'mplcursors' (pip install mplcursors)."
+        )
+
+
+def actualizar_lineas(lineas, t, series, etiquetas):
+    """
+    Reutiliza las curvas de la lista 'lineas' (una por serie) cambiando sus
+    datos con set_data; sólo crea o elimina curvas si cambió su número.
+    El color depende sólo de la posición de la serie ("C0", "C1", ...), no
+    de cuántas curvas se hayan creado antes en el eje.
+    """
+    series = list(series)
+    while len(lineas) > len(series):
+        lineas.pop().remove()
+    while len(lineas) < len(series):
+        ln, = ax.plot([], [], color=f"C{len(lineas)}")
+        lineas.append(ln)
+    for ln, y, etiqueta in zip(lineas, series, etiquetas):
+        ln.set_data(t, y)
+        ln.set_label(etiqueta)
+
+
+def mostrar_lineas(visibles):
+    """
+    Deja visibles sólo las curvas de 'visibles' (las demás se ocultan en
+    lugar de borrarse) y ajusta la escala de los ejes a lo visible, por lo
+    que las marcas del pico deben actualizarse antes.
+    """
+    global texto_inicial
+    if texto_inicial is not None:
+        texto_inicial.remove()
+        texto_inicial = None
+        ax.set_axis_on()
+
+    conjunto_visibles = set(visibles)
+    for ln in lineas_seir + lineas_lote + lineas_beta:
+        ln.set_visible(ln in conjunto_visibles)
+    ax.relim(visible_only=True)
+    ax.autoscale_view()
+    ax.legend(handles=visibles)
+
+
+def marcar_pico(dias_pico, valores_pico, texto=None):
+    """
+    Marca los picos (dias_pico, valores_pico); con None se ocultan. Si se da
+    'texto', además se dibuja la línea vertical y la nota del pico (sólo
+    para un escenario). Los artistas se crean una vez y luego se actualizan.
+    """
+    if not artistas_pico:
+        artistas_pico["marcador"], = ax.plot(
+            [], [], linestyle="none", marker='o', markersize=6, color='red'
+        )
+        artistas_pico["vertical"] = ax.axvline(0, linestyle='--', alpha=0.6)
+        artistas_pico["nota"] = ax.annotate(
+            "", xy=(0, 0), xytext=(0, 0),
+            arrowprops=dict(arrowstyle="->", alpha=0.7),
+            bbox=dict(boxstyle="round,pad=0.3", alpha=0.2)
+        )
+
+    marcador = artistas_pico["marcador"]
+    vertical = artistas_pico["vertical"]
+    nota = artistas_pico["nota"]
+
+    marcador.set_visible(dias_pico is not None)
+    if dias_pico is not None:
+        marcador.set_data(np.atleast_1d(dias_pico), np.atleast_1d(valores_pico))
+
+    vertical.set_visible(texto is not None)
+    nota.set_visible(texto is not None)
+    if texto is not None:
+        text_x = min(dias_pico + DAYS_POR_MES * 0.2, last_results["dias"] - 1)
+        vertical.set_xdata([dias_pico, dias_pico])
+        nota.xy = (dias_pico, valores_pico)
+        nota.set_position((text_x, valores_pico))
+        nota.set_text(texto)
+
+
 def plot_seir():
-    global last_results, ax, canvas, current_plot_mode, hover_cursor
+    global current_plot_mode
 
     if last_results is None:
         messagebox.showinfo("Sin datos", "Primero ejecuta una simulación.")
@@ -279,64 +701,94 @@ def plot_seir():
 
     current_plot_mode = "seir"
     res = last_results
-    t = res["t"]
-    S = res["S"]
-    E = res["E"]
-    I = res["I"]
-    R = res["R"]
     dias = res["dias"]
+    # submuestreo para simulaciones largas (las curvas son suaves); t conserva
+    # los días reales, así el hover sigue mostrando el día correcto. Se
+    # agrega siempre el último día para que la curva llegue al final del eje.
+    paso = max(1, dias // MAX_PUNTOS_GRAFICA)
+    idx = np.r_[0:dias - 1:paso, dias - 1]
+    t = res["t"][idx]
+
+    if res["lote"]:
+        plot_seir_lote(res, t, idx)
+        return
 
-    ax.clear()
+    actualizar_lineas(
+        lineas_seir, t,
+        [res["S"][idx], res["E"][idx], res["I"][idx], res["R"][idx]],
+        [
+            "Personas susceptibles (S)",
+            "Personas en incubación (E)",
+            "Personas enfermas (I)",
+            "Personas inmunes/recuperadas (R)",
+        ],
+    )
 
-    lnS, = ax.plot(t, S, label="Personas susceptibles (S)")
-    lnE, = ax.plot(t, E, label="Personas en incubación (E)")
-    lnI, = ax.plot(t, I, label="Personas enfermas (I)")
-    lnR, = ax.plot(t, R, label="Personas inmunes/recuperadas (R)")
+    # marcar pico
+    peak_day = res["peak_day"]
+    peak_value = res["peak_value"]
+    peak_month_name = res["peak_month_name"]
+    marcar_pico(peak_day, peak_value, f"Pico: {peak_value:.0f}\n{peak_month_name}")
 
+    mostrar_lineas(lineas_seir)
     preparar_eje_meses(ax, dias)
     ax.set_ylabel("Número de personas")
     ax.set_title(res["titulo_seir"])
-    ax.legend()
     ax.grid(True, alpha=0.3)
 
-    # marcar pico
-    peak_day = res["peak_day"]
-    peak_value = res["peak_value"]
-    peak_month_name = res["peak_month_name"]
+    canvas.draw_idle()
 
-    ax.plot(peak_day, peak_value, marker='o', markersize=6, color='red')
-    ax.axvline(peak_day, linestyle='--', alpha=0.6)
-    text_x = min(peak_day + DAYS_POR_MES * 0.2, dias - 1)
-    ax.annotate(
-        f"Pico: {peak_value:.0f}\n{peak_month_name}",
-        xy=(peak_day, peak_value),
-        xytext=(text_x, peak_value),
-        arrowprops=dict(arrowstyle="->", alpha=0.7),
-        bbox=dict(boxstyle="round,pad=0.3", alpha=0.2)
+    # Interactividad opcional
+    if var_interactive.get():
+        activar_hover(
+            list(lineas_seir),
+            lambda sel: f"{sel.artist.get_label()}\nDía {int(sel.target[0])}\nValor {sel.target[1]:.0f}"
+        )
+
+
+def escenarios_a_graficar(res):
+    """
+    Índices de los escenarios del lote que se grafican: todos si son hasta
+    MAX_ESCENARIOS_GRAFICA; si no, sólo esa cantidad, los de mayor pico
+    (una curva y una entrada de leyenda por escenario no escalan a archivos
+    con cientos de filas). Devuelve (indices, sufijo para el título).
+    """
+    P = len(res["peak_value"])
+    if P <= MAX_ESCENARIOS_GRAFICA:
+        return np.arange(P), ""
+    indices = np.argsort(res["peak_value"])[::-1][:MAX_ESCENARIOS_GRAFICA]
+    return indices, f"\n({MAX_ESCENARIOS_GRAFICA} de {P} escenarios, los de mayor pico)"
+
+
+def plot_seir_lote(res, t, idx):
+    """
+    Gráfica de un lote de escenarios: una curva de personas enfermas (I)
+    por escenario, con su pico marcado.
+    """
+    indices, sufijo = escenarios_a_graficar(res)
+    actualizar_lineas(
+        lineas_lote, t, res["I"][np.ix_(idx, indices)].T,
+        [res["nombres"][k] for k in indices]
     )
+    marcar_pico(res["peak_day"][indices], res["peak_value"][indices])
 
-    canvas.draw()
+    mostrar_lineas(lineas_lote)
+    preparar_eje_meses(ax, res["dias"])
+    ax.set_ylabel("Personas enfermas (I)")
+    ax.set_title(res["titulo_seir"] + sufijo)
+    ax.grid(True, alpha=0.3)
+
+    canvas.draw_idle()
 
-    # Interactividad opcional
     if var_interactive.get():
-        try:
-            import mplcursors
-            hover_cursor = mplcursors.cursor([lnS, lnE, lnI, lnR], hover=True)
-            hover_cursor.connect(
-                "add",
-                lambda sel: sel.annotation.set_text(
-                    f"{sel.artist.get_label()}\nDía {int(sel.target[0])}\nValor {sel.target[1]:.0f}"
-                )
-            )
-        except Exception:
-            messagebox.showinfo(
-                "Interactividad no disponible",
-                "Para activar hover instala la librería 'mplcursors' (pip install mplcursors)."
-            )
+        activar_hover(
+            list(lineas_lote),
+            lambda sel: f"{sel.artist.get_label()}\nDía {int(sel.target[0])}\nEnfermos {sel.target[1]:.0f}"
+        )
 
 
 def plot_beta():
-    global last_results, ax, canvas, current_plot_mode, hover_cursor
+    global current_plot_mode
 
     if last_results is None:
         messagebox.showinfo("Sin datos", "Primero ejecuta una simulación.")
@@ -347,36 +799,36 @@ def plot_beta():
 
     current_plot_mode = "beta"
     res = last_results
-    t = res["t"]
-    beta_t = res["beta_t"]
     dias = res["dias"]
+    paso = max(1, dias // MAX_PUNTOS_GRAFICA)
+    idx = np.r_[0:dias - 1:paso, dias - 1]
+    t = res["t"][idx]
+    beta_t = res["beta_t"][idx]
+
+    sufijo = ""
+    if res["lote"]:
+        indices, sufijo = escenarios_a_graficar(res)
+        actualizar_lineas(
+            lineas_beta, t, beta_t[:, indices].T,
+            [res["nombres"][k] for k in indices]
+        )
+    else:
+        actualizar_lineas(lineas_beta, t, [beta_t], ["Tasa estacional de transmisión"])
+    marcar_pico(None, None)
 
-    ax.clear()
-
-    lnB, = ax.plot(t, beta_t, label="Tasa estacional de transmisión")
+    mostrar_lineas(lineas_beta)
     preparar_eje_meses(ax, dias)
     ax.set_ylabel("Tasa de transmisión β(t) (1/día)")
-    ax.set_title(res["titulo_beta"])
+    ax.set_title(res["titulo_beta"] + sufijo)
     ax.grid(True, alpha=0.3)
-    ax.legend()
 
-    canvas.draw()
+    canvas.draw_idle()
 
     if var_interactive.get():
-        try:
-            import mplcursors
-            hover_cursor = mplcursors.cursor([lnB], hover=True)
-            hover_cursor.connect(
-                "add",
-                lambda sel: sel.annotation.set_text(
-                    f"Tasa de transmisión\nDía {int(sel.target[0])}\nValor {sel.target[1]:.3f} 1/día"
-                )
-            )
-        except Exception:
-            messagebox.showinfo(
-                "Interactividad no disponible",
-                "Para activar hover instala la librería 'mplcursors' (pip install mplcursors)."
-            )
+        activar_hover(
+            list(lineas_beta),
+            lambda sel: f"{sel.artist.get_label()}\nDía {int(sel.target[0])}\nValor {sel.target[1]:.3f} 1/día"
+        )
 
 
 def on_hover_toggle(*args):
@@ -436,59 +888,75 @@ def simular_desde_campos():
         messagebox.showerror("Error de datos", str(e))
 
 
-def cargar_excel_y_simular():
+def leer_tabla_parametros(nrows=None):
     """
-    Lee parámetros desde un archivo Excel o CSV y corre la simulación
-    usando la PRIMERA FILA.
-    NO rellena las cajas de texto: los campos quedan para edición manual.
+    Pide un archivo Excel o CSV y devuelve su tabla de parámetros como
+    DataFrame, o None si el usuario canceló o el archivo no es válido
+    (en ese caso ya se mostró el mensaje de error).
+    Sólo se leen las columnas de COLUMNAS_DATOS y, si se indica, las
+    primeras 'nrows' filas.
     - Si es Excel: lee la hoja llamada 'Datos'.
     - Si es CSV: lee el archivo directo.
     """
-    global last_results
-
     ruta = filedialog.askopenfilename(
         title="Selecciona archivo de Excel/CSV con los parámetros",
         filetypes=[("Archivos de Excel/CSV", "*.xlsx *.xls *.csv")]
     )
     if not ruta:
-        return  # usuario canceló
+        return None  # usuario canceló
+
+    import pandas as pd
+
+    # columnas a leer; las que falten se detectan abajo con un mensaje claro
+    def usar_columna(col):
+        return col in COLUMNAS_DATOS
 
     try:
         if ruta.lower().endswith(".csv"):
-            df = pd.read_csv(ruta)
+            df = pd.read_csv(ruta, usecols=usar_columna, nrows=nrows)
         else:
             # Leemos hoja "Datos"
             try:
-                df = pd.read_excel(ruta, sheet_name="Datos")
+                df = pd.read_excel(ruta, sheet_name="Datos", usecols=usar_columna, nrows=nrows)
             except ValueError:
                 messagebox.showerror(
                     "Error en la hoja",
                     "El archivo de Excel debe tener una hoja llamada 'Datos'."
                 )
-                return
-
-        columnas_esperadas = [
-            "Año del escenario", "Nombre del lugar",
-            "Población total (N)", "Infectados iniciales (I0)",
-            "Expuestos iniciales (E0)", "Recuperados iniciales (R0)",
-            "Tasa base de transmisión (beta0)",
-            "Días de incubación", "Días infecciosos",
-            "Días de simulación",
-            "Fuerza estacional (0 a 1)",
-        ]
-        for col in columnas_esperadas:
-            if col not in df.columns:
-                messagebox.showerror(
-                    "Columnas faltantes",
-                    "La hoja 'Datos' debe tener estas columnas:\n" +
-                    ", ".join(columnas_esperadas)
-                )
-                return
+                return None
+    except Exception as e:
+        messagebox.showerror("Error al leer archivo", f"No se pudo leer el archivo:\n{e}")
+        return None
 
-        if len(df) == 0:
-            messagebox.showerror("Archivo vacío", "La hoja 'Datos' no tiene filas de datos.")
-            return
+    for col in COLUMNAS_DATOS:
+        if col not in df.columns:
+            messagebox.showerror(
+                "Columnas faltantes",
+                "La hoja 'Datos' debe tener estas columnas:\n" +
+                ", ".join(COLUMNAS_DATOS)
+            )
+            return None
 
+    if len(df) == 0:
+        messagebox.showerror("Archivo vacío", "La hoja 'Datos' no tiene filas de datos.")
+        return None
+
+    return df
+
+
+def cargar_excel_y_simular():
+    """
+    Lee parámetros desde un archivo Excel o CSV y corre la simulación
+    usando la PRIMERA FILA.
+    NO rellena las cajas de texto: los campos quedan para edición manual.
+    """
+    global last_results
+
+    df = leer_tabla_parametros(nrows=1)
+    if df is None:
+        return
+
+    try:
         fila = df.iloc[0]
 
         anio = int(fila["Año del escenario"])
@@ -525,21 +993,66 @@ def cargar_excel_y_simular():
         messagebox.showerror("Error al leer archivo", f"No se pudo leer el archivo:\n{e}")
 
 
+def cargar_excel_y_simular_todas():
+    """
+    Lee parámetros desde un archivo Excel o CSV y simula TODAS LAS FILAS
+    juntas (una por escenario) para compararlas en la misma gráfica.
+    Todas se simulan con la duración más larga indicada en el archivo; si
+    las filas piden duraciones distintas se avisa al usuario.
+    """
+    global last_results
+
+    df = leer_tabla_parametros()
+    if df is None:
+        return
+
+    try:
+        anios = df["Año del escenario"].astype(int).unique()
+        # el año sólo aparece en el título si todos los escenarios lo comparten
+        anio = int(anios[0]) if len(anios) == 1 else None
+        nombres = df["Nombre del lugar"].astype(str).tolist()
+        duraciones = df["Días de simulación"].astype(int)
+        dias = int(duraciones.max())
+
+        if duraciones.nunique() > 1:
+            messagebox.showinfo(
+                "Duraciones distintas",
+                "Las filas del archivo piden distintos días de simulación "
+                f"(de {int(duraciones.min())} a {dias}).\n"
+                f"Todos los escenarios se simularán durante {dias} días."
+            )
+
+        res = correr_simulacion(
+            df["Población total (N)"].to_numpy(dtype=float),
+            df["Infectados iniciales (I0)"].to_numpy(dtype=float),
+            df["Expuestos iniciales (E0)"].to_numpy(dtype=float),
+            df["Recuperados iniciales (R0)"].to_numpy(dtype=float),
+            df["Tasa base de transmisión (beta0)"].to_numpy(dtype=float),
+            df["Días de incubación"].to_numpy(dtype=float),
+            df["Días infecciosos"].to_numpy(dtype=float),
+            dias,
+            df["Fuerza estacional (0 a 1)"].to_numpy(dtype=float),
+            anio=anio,
+            nombre=nombres,
+            days_por_mes=DAYS_POR_MES,
+        )
+
+        if res:
+            last_results = res
+            actualizar_labels_resultados(res)
+            plot_seir()
+
+    except Exception as e:
+        messagebox.showerror("Error al leer archivo", f"No se pudo leer el archivo:\n{e}")
+
+
 def generar_formato_vacio():
     """
     Genera un archivo Excel con DOS hojas:
     - 'Instrucciones': explicación de cada campo.
     - 'Datos': plantilla vacía con las columnas a rellenar (nombres descriptivos).
     """
-    columnas_datos = [
-        "Año del escenario", "Nombre del lugar",
-        "Población total (N)", "Infectados iniciales (I0)",
-        "Expuestos iniciales (E0)", "Recuperados iniciales (R0)",
-        "Tasa base de transmisión (beta0)",
-        "Días de incubación", "Días infecciosos",
-        "Días de simulación",
-        "Fuerza estacional (0 a 1)",
-    ]
+    import pandas as pd
 
     # Hoja de instrucciones
     filas_instr = [
@@ -590,15 +1103,16 @@ def generar_formato_vacio():
         {
             "Campo": "",
             "Descripción": (
-                "IMPORTANTE: la simulación leerá SIEMPRE la hoja 'Datos' "
-                "y usará solamente la PRIMERA fila de parámetros que encuentre."
+                "IMPORTANTE: la simulación leerá SIEMPRE la hoja 'Datos'. "
+                "El botón 'Cargar archivo Excel/CSV y simular' usa solamente la PRIMERA fila; "
+                "'Simular todas las filas del archivo' simula todas las filas como escenarios."
             ),
         },
     ]
     df_instr = pd.DataFrame(filas_instr, columns=["Campo", "Descripción"])
 
     # Hoja de datos vacía
-    df_datos = pd.DataFrame(columns=columnas_datos)
+    df_datos = pd.DataFrame(columns=COLUMNAS_DATOS)
 
     ruta = filedialog.asksaveasfilename(
         title="Guardar plantilla de parámetros",
@@ -721,6 +1235,11 @@ btn_excel = ttk.Button(left_frame, text="Cargar archivo Excel/CSV y simular",
                        command=cargar_excel_y_simular)
 btn_excel.grid(row=row, column=0, columnspan=2, pady=5, sticky="ew")
 
+row += 1
+btn_excel_todas = ttk.Button(left_frame, text="Simular todas las filas del archivo",
+                             command=cargar_excel_y_simular_todas)
+btn_excel_todas.grid(row=row, column=0, columnspan=2, pady=5, sticky="ew")
+
 row += 1
 btn_formato = ttk.Button(left_frame, text="Crear plantilla de Excel para rellenar",
                          command=generar_formato_vacio)
@@ -762,17 +1281,6 @@ left_frame.columnconfigure(1, weight=1)
 # --------- LADO DERECHO: GRÁFICAS ---------
 ttk.Label(right_frame, text="Gráficas de la simulación", font=("Arial", 12, "bold")).pack(pady=(0, 5))
 
-fig = Figure(figsize=(6, 5), dpi=100)
-ax = fig.add_subplot(111)
-ax.text(0.5, 0.5, "Ejecuta una simulación para ver las gráficas",
-        ha="center", va="center", transform=ax.transAxes)
-ax.set_axis_off()
-
-canvas = FigureCanvasTkAgg(fig, master=right_frame)
-canvas_widget = canvas.get_tk_widget()
-canvas_widget.pack(fill="both", expand=True)
-canvas.draw()
-
 buttons_frame = ttk.Frame(right_frame)
 buttons_frame.pack(fill="x", pady=(5, 0))
 
@@ -793,12 +1301,35 @@ btn_plot_beta.pack(side="left", expand=True, fill="x", padx=(5, 0))
 right_frame.columnconfigure(0, weight=1)
 
 
+def crear_grafica():
+    """
+    Crea la figura y su canvas dentro del lado derecho. Se llama al entrar
+    al simulador, así matplotlib no se carga mientras se ve la bienvenida.
+    """
+    global fig, ax, canvas, texto_inicial
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(6, 5), dpi=100)
+    ax = fig.add_subplot(111)
+    texto_inicial = ax.text(0.5, 0.5, "Ejecuta una simulación para ver las gráficas",
+                            ha="center", va="center", transform=ax.transAxes)
+    ax.set_axis_off()
+
+    canvas = FigureCanvasTkAgg(fig, master=right_frame)
+    canvas_widget = canvas.get_tk_widget()
+    canvas_widget.pack(fill="both", expand=True, before=buttons_frame)
+    canvas.draw()
+
+
 # ===========================
 # PANTALLA DE BIENVENIDA
 # ===========================
 
 def ir_a_principal():
     welcome_frame.pack_forget()
+    if canvas is None:
+        crear_grafica()
     main_frame.pack(fill="both", expand=True)
 
 